@@ -1,5 +1,5 @@
 """Configuration module for Open Notebook with vLLM."""
 
-from .settings import Settings, get_settings
+from .settings import Settings, get_settings, reset_settings
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_settings", "reset_settings"]
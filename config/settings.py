@@ -4,15 +4,94 @@ All configuration is loaded from environment variables to avoid hardcoding.
 """
 
 import os
-from dataclasses import dataclass
-from functools import lru_cache
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from dotenv import load_dotenv
+# Candidate .env location relative to the package, resolved once at import.
+# Joined with os.path rather than pathlib since only the string is needed.
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_PACKAGE_ENV_PATH = os.path.join(os.path.dirname(_HERE), "docker", ".env")
 
+# Parsed .env contents keyed by (path, mtime_ns, size) so repeated loads of
+# an unchanged file skip the parse entirely.
+_DOTENV_CACHE: dict[tuple[str, int, int], dict[str, str]] = {}
 
-@dataclass
+
+def _load_env_file(path: str) -> bool:
+    """
+    Apply the variables from a .env file to os.environ.
+
+    Mirrors load_dotenv's default semantics (existing environment variables
+    win), but memoizes the parsed file by mtime and size so unchanged files
+    cost one stat instead of a full re-parse.
+
+    Returns:
+        True if the file existed and was applied, False otherwise.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+
+    key = (path, st.st_mtime_ns, st.st_size)
+    values = _DOTENV_CACHE.get(key)
+    if values is None:
+        # Imported lazily so `import config` stays cheap for callers that
+        # only read already-populated environment variables.
+        from dotenv import dotenv_values
+
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        _DOTENV_CACHE[key] = values
+
+    setdefault = os.environ.setdefault
+    for k, v in values.items():
+        setdefault(k, v)
+    return True
+
+
+# Parsed port strings. The same handful of values recurs across worker
+# restarts and test runs, so a hit skips the int parser entirely.
+_PORT_CACHE: dict[str, int] = {}
+
+
+def _parse_port(value: str) -> int:
+    """Parse a port string to int, memoizing previously seen values."""
+    port = _PORT_CACHE.get(value)
+    if port is None:
+        port = int(value)
+        _PORT_CACHE[value] = port
+    return port
+
+
+# Field wiring for Settings.from_env: (field name, env var, default, parser).
+# Adding a setting means adding one row here plus the dataclass field.
+_FIELDS = (
+    # Application Settings
+    ("app_port", "APP_PORT", "8501", _parse_port),
+    ("log_level", "LOG_LEVEL", "INFO", str),
+
+    # SurrealDB Configuration
+    ("surreal_address", "SURREAL_ADDRESS", "ws://surreal-db:8000", str),
+    ("surreal_port", "SURREAL_PORT", "8000", _parse_port),
+    ("surreal_user", "SURREAL_USER", "root", str),
+    ("surreal_pass", "SURREAL_PASS", "root", str),
+    ("surreal_namespace", "SURREAL_NAMESPACE", "open_notebook", str),
+    ("surreal_database", "SURREAL_DATABASE", "open_notebook", str),
+
+    # vLLM / OpenAI Compatible API Configuration
+    ("openai_api_base", "OPENAI_API_BASE", "http://localhost:8000/v1", str),
+    ("openai_api_key", "OPENAI_API_KEY", "dummy-key", str),
+
+    # Model Configuration
+    ("default_chat_model", "DEFAULT_CHAT_MODEL", "gpt-oss-20b", str),
+    ("default_transformation_model", "DEFAULT_TRANSFORMATION_MODEL", "gpt-oss-20b", str),
+    ("default_embedding_model", "DEFAULT_EMBEDDING_MODEL", "gpt-oss-20b", str),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from environment variables."""
 
@@ -37,14 +116,44 @@ class Settings:
     default_transformation_model: str
     default_embedding_model: str
 
+    # Derived, built once in __post_init__ (slots=True rules out
+    # cached_property, which needs an instance __dict__).
+    openai_client_config: Mapping[str, str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "openai_client_config",
+            MappingProxyType({
+                "base_url": self.openai_api_base,
+                "api_key": self.openai_api_key,
+            }),
+        )
+
+    def __reduce__(self):
+        # The derived mappingproxy slot cannot be pickled; reconstruct from
+        # the init fields and let __post_init__ rebuild it.
+        return self.__class__, tuple(
+            getattr(self, f.name) for f in fields(self) if f.init
+        )
+
     @classmethod
-    def from_env(cls, env_file: Optional[Path] = None) -> "Settings":
+    def from_env(
+        cls,
+        env_file: Optional[Path] = None,
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> "Settings":
         """
         Load settings from environment variables.
 
         Args:
             env_file: Optional path to .env file. If not provided,
                      looks for .env in docker directory.
+            environ: Optional mapping to read variables from instead of
+                     os.environ. When given, no .env file is loaded —
+                     useful for hermetic tests that avoid filesystem I/O.
 
         Returns:
             Settings instance with loaded configuration.
@@ -52,42 +161,42 @@ class Settings:
         Raises:
             ValueError: If required environment variables are missing.
         """
+        if environ is not None:
+            get = environ.get
+            return cls(**{
+                name: parse(get(key, default))
+                for name, key, default, parse in _FIELDS
+            })
+
         if env_file:
-            load_dotenv(env_file)
+            _load_env_file(str(env_file))
         else:
-            # Try to find .env in common locations
-            possible_paths = [
-                Path(__file__).parent.parent / "docker" / ".env",
-                Path.cwd() / "docker" / ".env",
-                Path.cwd() / ".env",
-            ]
+            # Try to find .env in common locations.
+            cwd = os.getcwd()
+            possible_paths = (
+                _PACKAGE_ENV_PATH,
+                os.path.join(cwd, "docker", ".env"),
+                os.path.join(cwd, ".env"),
+            )
             for path in possible_paths:
-                if path.exists():
-                    load_dotenv(path)
+                if _load_env_file(path):
                     break
 
-        return cls(
-            # Application Settings
-            app_port=int(os.getenv("APP_PORT", "8501")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-
-            # SurrealDB Configuration
-            surreal_address=os.getenv("SURREAL_ADDRESS", "ws://surreal-db:8000"),
-            surreal_port=int(os.getenv("SURREAL_PORT", "8000")),
-            surreal_user=os.getenv("SURREAL_USER", "root"),
-            surreal_pass=os.getenv("SURREAL_PASS", "root"),
-            surreal_namespace=os.getenv("SURREAL_NAMESPACE", "open_notebook"),
-            surreal_database=os.getenv("SURREAL_DATABASE", "open_notebook"),
-
-            # vLLM / OpenAI Compatible API Configuration
-            openai_api_base=os.getenv("OPENAI_API_BASE", "http://localhost:8000/v1"),
-            openai_api_key=os.getenv("OPENAI_API_KEY", "dummy-key"),
-
-            # Model Configuration
-            default_chat_model=os.getenv("DEFAULT_CHAT_MODEL", "gpt-oss-20b"),
-            default_transformation_model=os.getenv("DEFAULT_TRANSFORMATION_MODEL", "gpt-oss-20b"),
-            default_embedding_model=os.getenv("DEFAULT_EMBEDDING_MODEL", "gpt-oss-20b"),
-        )
+        # Bind os.environ.get once so each field costs a single dict lookup
+        # instead of going through the os.getenv wrapper.
+        get = os.environ.get
+
+        return cls(**{
+            name: parse(get(key, default))
+            for name, key, default, parse in _FIELDS
+        })
+
+    # Required fields and the error message reported when each is missing.
+    _VALIDATE_RULES = (
+        ("openai_api_base", "OPENAI_API_BASE is required"),
+        ("default_chat_model", "DEFAULT_CHAT_MODEL is required"),
+        ("surreal_address", "SURREAL_ADDRESS is required"),
+    )
 
     def validate(self) -> list[str]:
         """
@@ -96,38 +205,64 @@ class Settings:
         Returns:
             List of validation error messages. Empty list if all valid.
         """
-        errors = []
-
-        if not self.openai_api_base:
-            errors.append("OPENAI_API_BASE is required")
+        return [
+            message
+            for attr, message in self._VALIDATE_RULES
+            if not getattr(self, attr)
+        ]
 
-        if not self.default_chat_model:
-            errors.append("DEFAULT_CHAT_MODEL is required")
+    def is_valid(self) -> bool:
+        """
+        Check whether all required settings are configured.
 
-        if not self.surreal_address:
-            errors.append("SURREAL_ADDRESS is required")
+        Faster than validate() for callers that only need a yes/no answer,
+        since it short-circuits without building the error list.
 
-        return errors
+        Returns:
+            True if all required settings are present.
+        """
+        return all(getattr(self, attr) for attr, _ in self._VALIDATE_RULES)
 
-    def get_openai_client_config(self) -> dict:
+    def get_openai_client_config(self) -> Mapping[str, str]:
         """
-        Get configuration dict for OpenAI client initialization.
+        Get configuration mapping for OpenAI client initialization.
 
         Returns:
-            Dictionary with base_url and api_key for OpenAI client.
+            Read-only mapping with base_url and api_key for OpenAI client.
         """
-        return {
-            "base_url": self.openai_api_base,
-            "api_key": self.openai_api_key,
-        }
+        return self.openai_client_config
+
+
+_settings: Optional[Settings] = None
 
 
-@lru_cache()
 def get_settings() -> Settings:
     """
     Get cached settings instance.
 
+    Uses a module-level singleton so repeated calls are plain attribute
+    reads with no lru_cache hash/lock overhead. Prefers the frozen module
+    generated by scripts/freeze_env.py when present, which skips the .env
+    search and parse entirely.
+
     Returns:
         Cached Settings instance loaded from environment.
     """
-    return Settings.from_env()
+    global _settings
+    if _settings is None:
+        try:
+            from ._env_frozen import SETTINGS as _settings  # type: ignore[no-redef]
+        except ImportError:
+            _settings = Settings.from_env()
+    return _settings
+
+
+def reset_settings() -> None:
+    """
+    Drop the cached Settings instance.
+
+    The next get_settings() call reloads from the environment. Intended
+    for tests that change environment variables between cases.
+    """
+    global _settings
+    _settings = None
@@ -0,0 +1,48 @@
+"""
+Freeze the resolved configuration into an importable Python module.
+
+Reads the environment (including docker/.env) through Settings.from_env
+and writes config/_env_frozen.py containing a literal Settings
+constructor call. At runtime get_settings() imports that module instead
+of searching for and parsing .env files, so startup pays only the .pyc
+load cost. Re-run this script whenever the deployed configuration
+changes:
+
+    python scripts/freeze_env.py
+"""
+
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import Settings
+
+FROZEN_PATH = Path(__file__).parent.parent / "config" / "_env_frozen.py"
+
+HEADER = '''"""
+Frozen settings generated by scripts/freeze_env.py. Do not edit by hand.
+"""
+
+from .settings import Settings
+
+'''
+
+
+def main() -> None:
+    settings = Settings.from_env()
+
+    lines = [HEADER, "SETTINGS = Settings(\n"]
+    for f in fields(Settings):
+        if not f.init:
+            continue
+        lines.append(f"    {f.name}={getattr(settings, f.name)!r},\n")
+    lines.append(")\n")
+
+    FROZEN_PATH.write_text("".join(lines))
+    print(f"Wrote {FROZEN_PATH}")
+
+
+if __name__ == "__main__":
+    main()
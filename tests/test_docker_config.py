@@ -29,20 +29,11 @@ import yaml
 
 
 class TestDockerComposeFile:
-    """Tests for docker-compose.yaml structure and content."""
+    """Tests for docker-compose.yaml structure and content.
 
-    @pytest.fixture
-    def docker_compose_path(self):
-        """Get path to docker-compose.yaml."""
-        return Path(__file__).parent.parent / "docker" / "docker-compose.yaml"
-
-    @pytest.fixture
-    def docker_compose_content(self, docker_compose_path):
-        """Load docker-compose.yaml content."""
-        if docker_compose_path.exists():
-            with open(docker_compose_path) as f:
-                return yaml.safe_load(f)
-        return None
+    The docker_compose_path and docker_compose_content fixtures are
+    session-scoped in conftest.py so the YAML is parsed once per run.
+    """
 
     def test_docker_compose_file_exists(self, docker_compose_path):
         """
@@ -155,17 +146,11 @@ class TestDockerComposeFile:
 
 
 class TestEnvFiles:
-    """Tests for .env and .env.example files."""
-
-    @pytest.fixture
-    def env_path(self):
-        """Get path to .env file."""
-        return Path(__file__).parent.parent / "docker" / ".env"
+    """Tests for .env and .env.example files.
 
-    @pytest.fixture
-    def env_example_path(self):
-        """Get path to .env.example file."""
-        return Path(__file__).parent.parent / "docker" / ".env.example"
+    The env_path and env_example_path fixtures are session-scoped in
+    conftest.py alongside the other shared docker paths.
+    """
 
     def test_env_file_exists(self, env_path):
         """
@@ -183,7 +168,7 @@ class TestEnvFiles:
         """
         assert env_example_path.exists(), f".env.example file not found at {env_example_path}"
 
-    def test_required_env_vars_in_env_file(self, env_path):
+    def test_required_env_vars_in_env_file(self, env_bytes):
         """
         Given: .env file exists
         When: Checking its content
@@ -198,23 +183,17 @@ class TestEnvFiles:
             "SURREAL_PASS",
         ]
 
-        with open(env_path) as f:
-            content = f.read()
-
-        for var in required_vars:
-            assert var in content, f"Required variable {var} not found in .env"
+        missing = [var for var in required_vars if var.encode() not in env_bytes]
+        assert not missing, f"Required variables not found in .env: {missing}"
 
-    def test_env_file_has_comments(self, env_path):
+    def test_env_file_has_comments(self, env_bytes):
         """
         Given: .env file exists
         When: Checking its content
         Then: It should have comments for documentation
         """
-        with open(env_path) as f:
-            content = f.read()
-
         # Check for comment lines
-        assert "#" in content, ".env file should have comments for documentation"
+        assert b"#" in env_bytes, ".env file should have comments for documentation"
 
     def test_env_example_has_placeholders(self, env_example_path):
         """
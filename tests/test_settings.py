@@ -8,6 +8,7 @@ Test Observation Table (Equivalence Partitioning & Boundary Values):
 | Load defaults                  | Normal        | No env vars                    | Default values loaded     |
 | Load from env vars             | Normal        | Valid env vars                 | Custom values loaded      |
 | Load from .env file            | Normal        | Valid .env file path           | Values from file loaded   |
+| Load from explicit env dict    | Normal        | environ={...}                  | Values from dict loaded   |
 | Empty string values            | Boundary      | OPENAI_API_BASE=""             | Empty string stored       |
 | Numeric port boundary (0)      | Boundary      | APP_PORT=0                     | Port set to 0             |
 | Numeric port boundary (65535)  | Boundary      | APP_PORT=65535                 | Port set to 65535         |
@@ -39,9 +40,6 @@ class TestSettingsFromEnv:
         When: Settings.from_env() is called with non-existent file
         Then: Default values should be returned
         """
-        # Clear cache to ensure fresh settings
-        get_settings.cache_clear()
-
         # Pass non-existent path to avoid loading from .env file
         settings = Settings.from_env(Path("/nonexistent/.env"))
 
@@ -58,8 +56,6 @@ class TestSettingsFromEnv:
         When: Settings.from_env() is called
         Then: Custom values should be loaded
         """
-        get_settings.cache_clear()
-
         settings = Settings.from_env()
 
         assert settings.app_port == 8501
@@ -77,14 +73,28 @@ class TestSettingsFromEnv:
         When: Settings.from_env() is called with the file path
         Then: Values from the file should be loaded
         """
-        get_settings.cache_clear()
-
         if env_file_path.exists():
             settings = Settings.from_env(env_file_path)
             # Check that settings were loaded (not necessarily specific values)
             assert settings.openai_api_base is not None
             assert settings.default_chat_model is not None
 
+    def test_load_from_explicit_environ(self):
+        """
+        Given: An explicit environment mapping
+        When: Settings.from_env() is called with environ=
+        Then: Values come from the mapping, ignoring os.environ and .env files
+        """
+        settings = Settings.from_env(environ={
+            "APP_PORT": "9000",
+            "OPENAI_API_BASE": "http://hermetic:8000/v1",
+        })
+
+        assert settings.app_port == 9000
+        assert settings.openai_api_base == "http://hermetic:8000/v1"
+        # Unlisted keys fall back to defaults
+        assert settings.default_chat_model == "gpt-oss-20b"
+
 
 class TestSettingsBoundaryValues:
     """Tests for boundary value conditions."""
@@ -95,7 +105,6 @@ class TestSettingsBoundaryValues:
         When: Settings.from_env() is called
         Then: Port should be set to 0
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("APP_PORT", "0")
 
         settings = Settings.from_env()
@@ -108,7 +117,6 @@ class TestSettingsBoundaryValues:
         When: Settings.from_env() is called
         Then: Port should be set to 65535
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("APP_PORT", "65535")
 
         settings = Settings.from_env()
@@ -121,7 +129,6 @@ class TestSettingsBoundaryValues:
         When: Settings.from_env() is called
         Then: Empty string should be stored (validation will catch this)
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("OPENAI_API_BASE", "")
 
         settings = Settings.from_env()
@@ -138,7 +145,6 @@ class TestSettingsAbnormalCases:
         When: Settings.from_env() is called
         Then: ValueError should be raised
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("APP_PORT", "abc")
 
         with pytest.raises(ValueError):
@@ -150,7 +156,6 @@ class TestSettingsAbnormalCases:
         When: Settings.from_env() is called
         Then: Port should be set to -1 (validation should catch this)
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("APP_PORT", "-1")
 
         # Negative port is technically valid for int(), but semantically wrong
@@ -163,8 +168,6 @@ class TestSettingsAbnormalCases:
         When: Settings.from_env() is called with the path
         Then: Should use defaults (file not found is not an error)
         """
-        get_settings.cache_clear()
-
         invalid_path = Path("/nonexistent/path/.env")
         settings = Settings.from_env(invalid_path)
 
@@ -181,8 +184,6 @@ class TestSettingsValidation:
         When: validate() is called
         Then: Empty error list should be returned
         """
-        get_settings.cache_clear()
-
         settings = Settings.from_env()
         errors = settings.validate()
 
@@ -194,7 +195,6 @@ class TestSettingsValidation:
         When: validate() is called
         Then: Error list should contain API base error
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("OPENAI_API_BASE", "")
 
         settings = Settings.from_env()
@@ -208,7 +208,6 @@ class TestSettingsValidation:
         When: validate() is called
         Then: Error list should contain model error
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("DEFAULT_CHAT_MODEL", "")
 
         settings = Settings.from_env()
@@ -222,7 +221,6 @@ class TestSettingsValidation:
         When: validate() is called
         Then: Error list should contain surreal address error
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("SURREAL_ADDRESS", "")
 
         settings = Settings.from_env()
@@ -236,7 +234,6 @@ class TestSettingsValidation:
         When: validate() is called
         Then: Error list should contain all errors
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("OPENAI_API_BASE", "")
         monkeypatch.setenv("DEFAULT_CHAT_MODEL", "")
         monkeypatch.setenv("SURREAL_ADDRESS", "")
@@ -246,6 +243,28 @@ class TestSettingsValidation:
 
         assert len(errors) == 3
 
+    def test_is_valid_all_required_fields_present(self, mock_env_vars):
+        """
+        Given: All required fields are properly set
+        When: is_valid() is called
+        Then: True should be returned
+        """
+        settings = Settings.from_env()
+
+        assert settings.is_valid() is True
+
+    def test_is_valid_missing_openai_api_base(self, monkeypatch):
+        """
+        Given: OPENAI_API_BASE is empty
+        When: is_valid() is called
+        Then: False should be returned
+        """
+        monkeypatch.setenv("OPENAI_API_BASE", "")
+
+        settings = Settings.from_env()
+
+        assert settings.is_valid() is False
+
 
 class TestGetOpenAIClientConfig:
     """Tests for get_openai_client_config() method."""
@@ -256,8 +275,6 @@ class TestGetOpenAIClientConfig:
         When: get_openai_client_config() is called
         Then: Dict with base_url and api_key should be returned
         """
-        get_settings.cache_clear()
-
         settings = Settings.from_env()
         config = settings.get_openai_client_config()
 
@@ -276,8 +293,6 @@ class TestGetSettings:
         When: get_settings() is called
         Then: Settings instance should be returned
         """
-        get_settings.cache_clear()
-
         settings = get_settings()
 
         assert isinstance(settings, Settings)
@@ -288,8 +303,6 @@ class TestGetSettings:
         When: get_settings() is called again
         Then: Same cached instance should be returned
         """
-        get_settings.cache_clear()
-
         settings1 = get_settings()
         settings2 = get_settings()
 
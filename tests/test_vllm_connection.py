@@ -22,48 +22,47 @@ Language: Python 3.10+
 Test Framework: pytest
 """
 
+import asyncio
+import os
+from types import SimpleNamespace
+from typing import Mapping
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import httpx
 
 # Import after adding to path in conftest
-from config.settings import Settings, get_settings
+from config.settings import Settings
 
 
 class TestVLLMEndpointConfiguration:
     """Tests for vLLM endpoint URL configuration."""
 
-    def test_valid_endpoint_url_format(self, mock_env_vars):
+    def test_valid_endpoint_url_format(self, built_settings):
         """
         Given: A valid vLLM endpoint URL is configured
         When: Settings are loaded
         Then: URL should be correctly formatted
         """
-        get_settings.cache_clear()
-
-        settings = Settings.from_env()
-
-        assert settings.openai_api_base.startswith("http")
-        assert "/v1" in settings.openai_api_base
-
-    def test_endpoint_url_with_different_ports(self, monkeypatch):
+        assert built_settings.openai_api_base.startswith("http")
+        assert "/v1" in built_settings.openai_api_base
+
+    @pytest.mark.parametrize("url", [
+        "http://localhost:8000/v1",
+        "http://localhost:8080/v1",
+        "http://192.168.1.100:3000/v1",
+    ])
+    def test_endpoint_url_with_different_ports(self, monkeypatch, url):
         """
         Given: Different port numbers in endpoint URL
         When: Settings are loaded
         Then: Port should be preserved in URL
         """
-        get_settings.cache_clear()
+        monkeypatch.setenv("OPENAI_API_BASE", url)
 
-        test_urls = [
-            "http://localhost:8000/v1",
-            "http://localhost:8080/v1",
-            "http://192.168.1.100:3000/v1",
-        ]
+        settings = Settings.from_env()
 
-        for url in test_urls:
-            monkeypatch.setenv("OPENAI_API_BASE", url)
-            settings = Settings.from_env()
-            assert settings.openai_api_base == url
+        assert settings.openai_api_base == url
 
     def test_endpoint_url_boundary_empty(self, monkeypatch):
         """
@@ -71,7 +70,6 @@ class TestVLLMEndpointConfiguration:
         When: Settings are loaded
         Then: Empty string should be stored
         """
-        get_settings.cache_clear()
         monkeypatch.setenv("OPENAI_API_BASE", "")
 
         settings = Settings.from_env()
@@ -82,31 +80,25 @@ class TestVLLMEndpointConfiguration:
 class TestOpenAIClientCreation:
     """Tests for OpenAI client configuration."""
 
-    def test_get_openai_client_config_returns_dict(self, mock_env_vars):
+    def test_get_openai_client_config_returns_dict(self, built_settings):
         """
         Given: Valid settings are configured
         When: get_openai_client_config() is called
         Then: A dictionary with required keys should be returned
         """
-        get_settings.cache_clear()
-
-        settings = Settings.from_env()
-        config = settings.get_openai_client_config()
+        config = built_settings.get_openai_client_config()
 
-        assert isinstance(config, dict)
+        assert isinstance(config, Mapping)
         assert "base_url" in config
         assert "api_key" in config
 
-    def test_openai_client_config_values(self, mock_env_vars):
+    def test_openai_client_config_values(self, built_settings):
         """
         Given: Specific endpoint and API key are set
         When: get_openai_client_config() is called
         Then: Config should contain those exact values
         """
-        get_settings.cache_clear()
-
-        settings = Settings.from_env()
-        config = settings.get_openai_client_config()
+        config = built_settings.get_openai_client_config()
 
         assert config["base_url"] == "http://test-vllm:8000/v1"
         assert config["api_key"] == "test-api-key"
@@ -115,22 +107,29 @@ class TestOpenAIClientCreation:
 class TestVLLMAPIRequests:
     """Tests for vLLM API request handling (mocked)."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_openai_client(self):
-        """Create a mock OpenAI client."""
+        """Create a mock OpenAI client, shared across the module."""
         client = MagicMock()
         return client
 
+    @pytest.fixture(autouse=True)
+    def _reset_mock_client(self, mock_openai_client):
+        """Clear call history between tests while reusing the mock graph."""
+        yield
+        mock_openai_client.reset_mock(side_effect=True, return_value=True)
+
     def test_list_models_request_format(self, mock_openai_client):
         """
         Given: A configured OpenAI client
         When: Listing available models
         Then: Request should be made to /v1/models endpoint
         """
-        # Setup mock response
-        mock_model = MagicMock()
-        mock_model.id = "gpt-oss-20b"
-        mock_openai_client.models.list.return_value = MagicMock(data=[mock_model])
+        # Setup mock response; SimpleNamespace is far cheaper than a
+        # MagicMock tree for plain attribute holders
+        mock_openai_client.models.list.return_value = SimpleNamespace(
+            data=[SimpleNamespace(id="gpt-oss-20b")]
+        )
 
         # Execute
         response = mock_openai_client.models.list()
@@ -147,11 +146,9 @@ class TestVLLMAPIRequests:
         Then: Request should have correct structure
         """
         # Setup mock response
-        mock_choice = MagicMock()
-        mock_choice.message.content = "Test response"
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        mock_openai_client.chat.completions.create.return_value = mock_response
+        mock_openai_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Test response"))]
+        )
 
         # Execute
         response = mock_openai_client.chat.completions.create(
@@ -185,84 +182,92 @@ class TestVLLMAPIRequests:
 
 
 class TestVLLMConnectionErrors:
-    """Tests for connection error handling."""
-
-    def test_connection_timeout_handling(self, mock_env_vars):
-        """
-        Given: vLLM server is unreachable
-        When: Making an API request
-        Then: Timeout error should be raised
-        """
-        get_settings.cache_clear()
-
-        # This test verifies error handling, not actual connection
-        with patch('httpx.Client.get') as mock_get:
-            mock_get.side_effect = httpx.TimeoutException("Connection timed out")
-
-            with pytest.raises(httpx.TimeoutException):
-                client = httpx.Client()
-                client.get("http://unreachable:8000/v1/models")
-
-    def test_connection_refused_handling(self, mock_env_vars):
+    """Tests for connection error handling.
+
+    Uses the pooled httpx.AsyncClient fixture so the tests exercise the
+    same client type the app uses against vLLM in production.
+    """
+
+    @pytest.mark.parametrize("exc, target", [
+        (
+            httpx.TimeoutException("Connection timed out"),
+            "http://unreachable:8000/v1/models",
+        ),
+        (
+            httpx.ConnectError("Connection refused"),
+            "http://localhost:9999/v1/models",
+        ),
+    ])
+    @pytest.mark.asyncio
+    async def test_transport_error_propagates(
+        self, async_client, mock_env_vars, exc, target
+    ):
         """
-        Given: vLLM server is not running
+        Given: vLLM server is unreachable or not running
         When: Making an API request
-        Then: Connection refused error should be raised
+        Then: The transport error should be raised
         """
-        get_settings.cache_clear()
+        # These tests verify error handling, not actual connections
+        with patch.object(httpx.AsyncClient, 'get', new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = exc
 
-        with patch('httpx.Client.get') as mock_get:
-            mock_get.side_effect = httpx.ConnectError("Connection refused")
+            with pytest.raises(type(exc)):
+                await async_client.get(target)
 
-            with pytest.raises(httpx.ConnectError):
-                client = httpx.Client()
-                client.get("http://localhost:9999/v1/models")
-
-    def test_invalid_model_name_handling(self):
+    @pytest.mark.asyncio
+    async def test_invalid_model_name_handling(self, async_client):
         """
         Given: An invalid model name is specified
-        When: Making a chat completion request
-        Then: Model not found error should be raised
+        When: Making concurrent chat completion requests
+        Then: Model not found errors should be returned on the shared pool
         """
-        with patch('httpx.Client.post') as mock_post:
+        with patch.object(httpx.AsyncClient, 'post', new_callable=AsyncMock) as mock_post:
             error_response = Mock()
             error_response.status_code = 404
             error_response.json.return_value = {"error": "Model not found"}
             mock_post.return_value = error_response
 
-            client = httpx.Client()
-            response = client.post(
-                "http://localhost:8000/v1/chat/completions",
-                json={"model": "nonexistent-model", "messages": []}
-            )
+            # Issue the mocked requests concurrently over the shared client
+            responses = await asyncio.gather(*[
+                async_client.post(
+                    "http://localhost:8000/v1/chat/completions",
+                    json={"model": "nonexistent-model", "messages": []}
+                )
+                for _ in range(3)
+            ])
 
-            assert response.status_code == 404
+            assert all(r.status_code == 404 for r in responses)
 
 
 class TestVLLMIntegration:
-    """Integration tests for vLLM (requires running vLLM server)."""
+    """Integration tests for vLLM (requires running vLLM server).
+
+    Skipped unless pytest is invoked with --run-integration (or the
+    RUN_INTEGRATION environment variable is set), so the default run
+    never touches the fixtures or the openai import.
+    """
+
+    pytestmark = [
+        pytest.mark.serial,
+        pytest.mark.skipif(
+            not os.getenv("RUN_INTEGRATION"),
+            reason="Requires running vLLM server (pass --run-integration)",
+        ),
+    ]
 
     @pytest.fixture
     def real_settings(self, env_file_path):
         """Load real settings from .env file."""
-        get_settings.cache_clear()
-        if env_file_path.exists():
-            return Settings.from_env(env_file_path)
-        return None
+        if not env_file_path.exists():
+            pytest.skip("No .env file found")
+        return Settings.from_env(env_file_path)
 
-    @pytest.mark.skip(reason="Requires running vLLM server")
     def test_real_connection_to_vllm(self, real_settings):
         """
         Given: vLLM server is running
         When: Making a real API request
         Then: Response should be received
-
-        Note: This test is skipped by default as it requires a running vLLM server.
-        Remove the skip decorator to run integration tests.
         """
-        if real_settings is None:
-            pytest.skip("No .env file found")
-
         from openai import OpenAI
 
         config = real_settings.get_openai_client_config()
@@ -272,19 +277,12 @@ class TestVLLMIntegration:
         models = client.models.list()
         assert len(models.data) > 0
 
-    @pytest.mark.skip(reason="Requires running vLLM server")
     def test_real_chat_completion(self, real_settings):
         """
         Given: vLLM server is running
         When: Making a chat completion request
         Then: Valid response should be generated
-
-        Note: This test is skipped by default as it requires a running vLLM server.
-        Remove the skip decorator to run integration tests.
         """
-        if real_settings is None:
-            pytest.skip("No .env file found")
-
         from openai import OpenAI
 
         config = real_settings.get_openai_client_config()